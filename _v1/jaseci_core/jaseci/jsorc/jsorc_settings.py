@@ -26,6 +26,9 @@ class JsOrcSettings:
         "pre_loaded_services": [],
     }
 
+    # Most recent actions history entries kept while actions tracking is active
+    ACTIONS_HISTORY_LIMIT = int(os.getenv("ACTIONS_HISTORY_LIMIT", "1024"))
+
     ###############################################################################################################
     # -------------------------------------------------- KUBE --------------------------------------------------- #
     ###############################################################################################################
@@ -0,0 +1,194 @@
+from itertools import product
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import jaseci.utils.actions.actions_optimizer as jao
+from jaseci.jsorc.live_actions import action_configs
+from jaseci.utils.actions.actions_optimizer import (
+    ActionsOptimizer,
+    EvaluationState,
+    NODE_MEM_THRESHOLD,
+)
+from jaseci.utils.utils import TestCaseHelper
+
+ACTION_MEM = {"use": 1000, "bi": 500, "ent": 700}
+RUNTIME_MEM = 300
+
+
+def mock_action_configs():
+    return {
+        name: {
+            "module": f"jac_nlp.{name}",
+            "loaded_module": f"jac_nlp.{name}.{name}",
+            "local_mem_requirement": mem,
+            "remote": {},
+        }
+        for name, mem in ACTION_MEM.items()
+    }
+
+
+class ActionsOptimizerTests(TestCaseHelper, TestCase):
+    """Unit tests for the actions optimizer, without kube or live action loading"""
+
+    def setUp(self):
+        super().setUp()
+        self.patches = [
+            patch.dict(action_configs, mock_action_configs(), clear=True),
+            patch.object(jao, "load_module_actions"),
+            patch.object(jao, "load_remote_actions"),
+            patch.object(jao, "unload_module"),
+            patch.object(jao, "unload_remote_actions"),
+        ]
+        for p in self.patches:
+            p.start()
+        self.opt = ActionsOptimizer(
+            benchmark={"active": False, "requests": {}},
+            actions_history={"active": False, "history": []},
+            actions_calls={},
+        )
+        self.opt.jsorc_interval = 10
+        self.opt.spawn_remote = Mock(side_effect=lambda name: f"http://{name}/")
+        self.opt.remote_action_ready_check = Mock(return_value=False)
+
+    def tearDown(self):
+        self.opt._pool.shutdown(wait=False)
+        for p in reversed(self.patches):
+            p.stop()
+        super().tearDown()
+
+    def eval_configs(self, node_mem):
+        self.opt.policy_params = {
+            "node_mem": node_mem,
+            "jaseci_runtime_mem": RUNTIME_MEM,
+        }
+        for name in ACTION_MEM:
+            self.opt.actions_state.init_state(name)
+        policy_state = EvaluationState(10, 100, {})
+        self.opt._init_evalution_policy(policy_state)
+        return list(policy_state.remain_configs)
+
+    def expected_configs(self, node_mem):
+        expected = []
+        for modes in product(["local", "remote"], repeat=len(ACTION_MEM)):
+            config = dict(zip(ACTION_MEM, modes))
+            local_mem = RUNTIME_MEM + sum(
+                ACTION_MEM[name] for name, mode in config.items() if mode == "local"
+            )
+            if local_mem < node_mem * NODE_MEM_THRESHOLD or "local" not in modes:
+                config["local_mem"] = local_mem
+                expected.append(config)
+        return expected
+
+    def test_eval_configs_gray_code_order(self):
+        configs = self.eval_configs(999 * 1024)
+        self.assertEqual(len(configs), 2 ** len(ACTION_MEM))
+        self.assertEqual(
+            configs[0],
+            {"local_mem": 2500, "use": "local", "bi": "local", "ent": "local"},
+        )
+        for prev, cur in zip(configs, configs[1:]):
+            changed = [name for name in ACTION_MEM if prev[name] != cur[name]]
+            self.assertEqual(len(changed), 1)
+
+    def test_eval_configs_memory_limits(self):
+        for node_mem in [100, 1000, 1500, 2500, 3200, 999 * 1024]:
+            configs = self.eval_configs(node_mem)
+            self.assertCountEqual(configs, self.expected_configs(node_mem))
+
+    def test_eval_configs_all_remote_always_kept(self):
+        configs = self.eval_configs(100)
+        self.assertEqual(
+            configs,
+            [
+                {
+                    "local_mem": RUNTIME_MEM,
+                    "use": "remote",
+                    "bi": "remote",
+                    "ent": "remote",
+                }
+            ],
+        )
+
+    def test_eval_configs_dropped_logged_once(self):
+        with patch.object(jao.logger, "info") as mock_info:
+            self.eval_configs(1500)
+        dropped_logs = [c for c in mock_info.call_args_list if "dropped" in c.args[0]]
+        self.assertEqual(len(dropped_logs), 1)
+        self.assertEqual(dropped_logs[0].args[1], 8 - len(self.expected_configs(1500)))
+
+    def test_load_action_module_result(self):
+        self.assertTrue(self.opt.load_action_module("use"))
+        self.assertTrue(self.opt.load_action_module("use"))
+        self.assertFalse(self.opt.load_action_module("not_an_action"))
+        jao.load_module_actions.assert_called_once_with(
+            "jac_nlp.use", "jac_nlp.use.use"
+        )
+
+    def test_apply_to_remote_from_unloaded(self):
+        self.opt.remote_action_ready_check.return_value = True
+        self.opt.actions_change = self.opt._get_action_change({"use": "remote"})
+        self.assertEqual(self.opt.actions_change, {"use": "_to_remote"})
+
+        self.opt.apply_actions_change()
+        self.assertEqual(self.opt.actions_change, {})
+        self.assertEqual(self.opt.get_actions_status("use")["mode"], "remote")
+        jao.load_remote_actions.assert_called_once_with("http://use/")
+
+    def test_apply_remote_to_module(self):
+        state = self.opt.actions_state
+        state.init_state("use")
+        state.start_remote_service("use", "http://use/")
+        state.set_remote_action_ready("use")
+        state.remote_action_loaded("use")
+
+        self.opt.actions_change = self.opt._get_action_change({"use": "local"})
+        self.assertEqual(self.opt.actions_change, {"use": "remote_to_module"})
+
+        self.opt.apply_actions_change()
+        self.assertEqual(self.opt.actions_change, {})
+        self.assertEqual(self.opt.get_actions_status("use")["mode"], "module")
+        jao.load_module_actions.assert_called_once_with(
+            "jac_nlp.use", "jac_nlp.use.use"
+        )
+
+    def test_apply_starting_remote_stays_pending(self):
+        ready_check = self.opt.remote_action_ready_check
+        self.opt.actions_change = self.opt._get_action_change({"use": "remote"})
+
+        # spawns the service, probed once while loading
+        self.opt.apply_actions_change()
+        self.assertEqual(self.opt.actions_change, {"use": "_to_remote"})
+        self.assertEqual(
+            self.opt.get_actions_status("use")["remote"]["status"], "STARTING"
+        )
+        self.assertEqual(ready_check.call_count, 1)
+
+        # still starting, probed once by the next interval
+        self.opt.apply_actions_change()
+        self.assertEqual(self.opt.actions_change, {"use": "_to_remote"})
+        self.assertEqual(ready_check.call_count, 2)
+
+        # service is up by the following interval
+        ready_check.return_value = True
+        self.opt.apply_actions_change()
+        self.assertEqual(ready_check.call_count, 3)
+        self.assertEqual(self.opt.actions_change, {})
+        self.assertEqual(self.opt.get_actions_status("use")["mode"], "remote")
+        jao.load_remote_actions.assert_called_once_with("http://use/")
+
+    def test_walker_totals_skip_default_walker(self):
+        self.assertEqual(self.opt._walker_totals(), (0.0, 0))
+        self.opt.benchmark["requests"] = {"walker_run": {"_default_": [0.5, 0.5]}}
+        self.assertEqual(self.opt._walker_totals(), (0.0, 0))
+        self.opt.benchmark["requests"]["walker_run"]["init"] = [0.25, 0.75]
+        self.assertEqual(self.opt._walker_totals(), (1.0, 2))
+
+    def test_eval_period_with_only_default_walker(self):
+        policy_state = EvaluationState(10, 100, {})
+        policy_state.cur_config = {"local_mem": RUNTIME_MEM, "use": "local"}
+        policy_state.cur_phase = 10
+        self.opt.benchmark["requests"] = {"walker_run": {"_default_": [0.5]}}
+
+        self.opt._evaluation_eval(policy_state)
+        self.assertEqual(policy_state.phase, "eval")
+        self.assertEqual(policy_state.past_configs, [])
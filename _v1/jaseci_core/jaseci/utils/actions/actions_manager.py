@@ -5,6 +5,7 @@ from .actions_optimizer import ActionsOptimizer
 
 import time
 import numpy as np
+from collections import deque
 
 
 @JsOrc.context("action_manager")
@@ -14,7 +15,11 @@ class ActionManager:
             "jsorc": {"active": False, "requests": {}},
             "actions_optimizer": {"active": False, "requests": {}},
         }
-        self.actions_history = {"active": False, "history": []}
+        self.actions_history = {
+            "active": False,
+            "start": None,
+            "history": deque(maxlen=JsOrc.settings("ACTIONS_HISTORY_LIMIT")),
+        }
         self.actions_calls = {}
         self.system_states = {"active": False, "states": []}
         self.actions_optimizer = ActionsOptimizer(
@@ -84,8 +89,14 @@ class ActionManager:
 
     def actions_tracking_start(self):
         """ """
+        start = {"ts": time.time()}
         self.actions_history["active"] = True
-        self.actions_history["history"] = [{"ts": time.time()}]
+        # the start entry is also kept outside the bounded history so that it
+        # is still reported once older entries get dropped
+        self.actions_history["start"] = start
+        self.actions_history["history"] = deque(
+            [start], maxlen=JsOrc.settings("ACTIONS_HISTORY_LIMIT")
+        )
         self.actions_calls.clear()
 
     def actions_tracking_stop(self):
@@ -95,7 +106,10 @@ class ActionManager:
 
         self.actions_optimizer.summarize_action_calls()
 
-        return self.actions_history["history"]
+        history = list(self.actions_history["history"])
+        if not history or history[0] is not self.actions_history["start"]:
+            history.insert(0, self.actions_history["start"])
+        return history
 
     def benchmark_start(self):
         """
@@ -235,10 +249,13 @@ class ActionManager:
     def post_action_call_hook(self, *args):
         action_name = args[0]
         action_time = args[1]
-        if action_name not in self.actions_calls:
-            self.actions_calls[action_name] = []
-
-        self.actions_calls[action_name].append(action_time)
+        # running [total time, call count] per action instead of every sample
+        calls = self.actions_calls.get(action_name)
+        if calls is None:
+            self.actions_calls[action_name] = [action_time, 1]
+        else:
+            calls[0] += action_time
+            calls[1] += 1
 
     def pre_request_hook(self, *args):
         pass
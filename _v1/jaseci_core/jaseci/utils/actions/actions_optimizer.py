@@ -16,17 +16,68 @@ from jaseci.jsorc.live_actions import (
 )
 
 import requests
-import copy
+import math
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from requests.adapters import HTTPAdapter
 
-from .actions_state import ActionsState
+from .actions_state import ActionsState, MODE_LOCAL, MODE_MODULE, MODE_REMOTE
 
 POLICIES = ["Default", "Evaluation"]
 THRESHOLD = 0.2
 NODE_MEM_THRESHOLD = 0.8
+# Upper bound (in seconds) on waiting for a batch of readiness probes
+READY_CHECK_TIMEOUT = 2
+
+
+class EvaluationState:
+    """
+    Tracking state of the Evaluation policy
+    """
+
+    __slots__ = (
+        "phase",
+        "cur_config",
+        "remain_configs",
+        "past_configs",
+        "best_config",
+        "best_lat",
+        "eval_phase",
+        "perf_phase",
+        "cur_phase",
+        "prev_best_config",
+    )
+
+    def __init__(self, eval_phase: int, perf_phase: int, prev_best_config: dict):
+        self.phase = "eval"  # current phase of policy: eval|perf|eval_switching
+        self.cur_config = None  # current active configuration
+        self.remain_configs = deque()  # configurations that still need evaluating
+        self.past_configs = []  # configurations already evaluated
+        self.best_config = None  # fastest configuration evaluated so far
+        self.best_lat = float("inf")  # walker latency of best_config
+        self.eval_phase = eval_phase  # how long is evaluatin period (in seconds)
+        self.perf_phase = perf_phase  # how long is the performance period (in seconds)
+        self.cur_phase = 0  # how long the current period has been running
+        self.prev_best_config = prev_best_config
 
 
 class ActionsOptimizer:
+    # Loader method for each change type produced by _get_action_change
+    _CHANGE_DISPATCH = {
+        "to_local": "load_action_module",
+        "_to_local": "load_action_module",
+        "to_module": "load_action_module",
+        "_to_module": "load_action_module",
+        "to_remote": "load_action_remote",
+        "_to_remote": "load_action_remote",
+        "local_to_remote": "load_action_remote",
+        "module_to_remote": "load_action_remote",
+        "remote_to_local": "load_action_module",
+        "remote_to_module": "load_action_module",
+    }
+
     def __init__(
         self,
         namespace: str = "default",
@@ -46,6 +97,21 @@ class ActionsOptimizer:
         self.policy_params = {}
         self.policy_state = {}
         self.last_eval_configs = []
+        # Keep-alive pool for readiness probes against action microservices
+        self._http = requests.Session()
+        self._http.mount(
+            "http://",
+            HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0),
+        )
+        # Only used by the interval loop (apply_actions_change), never from
+        # request handlers, which can be interrupted by the JSORC interval tick
+        self._pool = ThreadPoolExecutor(max_workers=16)
+        # Evaluation policy phase handlers, keyed by policy_state.phase
+        self._evaluation_handlers = {
+            "perf": self._evaluation_perf,
+            "eval": self._evaluation_eval,
+            "eval_switching": self._evaluation_switching,
+        }
 
     def kube_create(self, config):
         kube = JsOrc.svc("kube").poke(cast=KubeService)
@@ -110,7 +176,10 @@ class ActionsOptimizer:
         if cur_state is None:
             cur_state = self.actions_state.init_state(name)
 
-        if cur_state["mode"] == "remote" and cur_state["remote"]["status"] == "READY":
+        if (
+            cur_state["mode"] == MODE_REMOTE
+            and cur_state["remote"]["status"] == "READY"
+        ):
             # Check if there is already a remote action loaded
             return True
 
@@ -140,19 +209,20 @@ class ActionsOptimizer:
     def load_action_module(self, name, unload_existing=False):
         """
         Load an action module
+        Return True if the action module is loaded, False otherwise
         """
         cur_state = self.actions_state.get_state(name)
         logger.info(cur_state)
         if cur_state is None:
             cur_state = self.actions_state.init_state(name)
 
-        if cur_state["mode"] == "module":
+        if cur_state["mode"] == MODE_MODULE:
             logger.info("ALREADY A MODULE LOADED")
             # Check if there is already a local action loaded
-            return
+            return True
 
         if name not in action_configs:
-            return
+            return False
 
         module = action_configs[name]["module"]
         loaded_module = action_configs[name]["loaded_module"]
@@ -162,6 +232,7 @@ class ActionsOptimizer:
         load_module_actions(module, loaded_module)
         self.action_prep(name)
         self.actions_state.module_action_loaded(name, module, loaded_module)
+        return True
 
     def unload_action_auto(self, name):
         """
@@ -170,9 +241,9 @@ class ActionsOptimizer:
         cur_state = self.actions_state.get_state(name)
         if cur_state is None:
             return False, "Action is not loaded."
-        if cur_state["mode"] == "module":
+        if cur_state["mode"] == MODE_MODULE:
             return self.unload_action_module(name)
-        elif cur_state["mode"] == "remote":
+        elif cur_state["mode"] == MODE_REMOTE:
             return self.unload_action_remote(name)
         return False, f"Unrecognized action loaded status {cur_state['mode']}"
 
@@ -184,7 +255,7 @@ class ActionsOptimizer:
         if cur_state is None:
             return False, "Action is not loaded."
 
-        if cur_state["mode"] != "module":
+        if cur_state["mode"] != MODE_MODULE:
             return False, "Action is not loaded as module."
 
         module_name = cur_state["module"]["name"]
@@ -204,7 +275,7 @@ class ActionsOptimizer:
         if cur_state is None:
             return False, "Action is not loaded."
 
-        if cur_state["mode"] != "remote":
+        if cur_state["mode"] != MODE_REMOTE:
             return False, "Action is not loaded as remote."
 
         if cur_state["remote"]["status"] != "READY":
@@ -227,13 +298,37 @@ class ActionsOptimizer:
         spec_url = url.rstrip("/") + ACTIONS_SPEC_LOC
         headers = {"content-type": "application/json"}
         try:
-            res = requests.get(spec_url, headers=headers, timeout=1)
+            res = self._http.get(spec_url, headers=headers, timeout=1)
         except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
             # Remote service not ready yet
             return False
 
         return res.status_code == 200
 
+    def _ready_check_batch(self, names_urls):
+        """
+        Probe several starting remote actions concurrently.
+        Mark the ready ones in the actions state and return the names of those still starting,
+        including any whose probe did not finish within READY_CHECK_TIMEOUT
+        """
+        futures = {
+            self._pool.submit(self.remote_action_ready_check, name, url): name
+            for name, url in names_urls
+        }
+        # Runs from the JSORC interval tick, never wait on a hung probe
+        not_ready = set(futures.values())
+        try:
+            for future in as_completed(futures, timeout=READY_CHECK_TIMEOUT):
+                name = futures[future]
+                if future.result():
+                    self.actions_state.set_remote_action_ready(name)
+                    not_ready.discard(name)
+        except FuturesTimeoutError:
+            # probes still outstanding count as not ready, retried next interval
+            for future in futures:
+                future.cancel()
+        return not_ready
+
     def set_action_policy(self, policy_name: str, policy_params: dict = {}):
         """
         Set the action optimization policy for JSORC
@@ -241,7 +336,8 @@ class ActionsOptimizer:
         # TODO: manage policy switching if there are unresolved actions state
         if policy_name in POLICIES:
             self.policy = policy_name
-            self.policy_state[policy_name] = {}
+            # policy tracking state is created on the policy's first run
+            self.policy_state[policy_name] = None
             self.policy_params = policy_params
             return True
         else:
@@ -271,31 +367,42 @@ class ActionsOptimizer:
         # 999 is just really large memory size so everything can fits in local
         node_mem = self.policy_params.get("node_mem", 999 * 1024)
         jaseci_runtime_mem = self.policy_params.get("jaseci_runtime_mem", 300)
+        mem_limit = node_mem * NODE_MEM_THRESHOLD
         # Initialize configs to eval
         actions = self.actions_state.get_active_actions()
-        # construct list of possible configurations
-        all_configs = [{"local_mem": jaseci_runtime_mem}]
-        for act in actions:
-            new_configs = []
-            for con in all_configs:
-                for m in ["local", "remote"]:
-                    c = copy.deepcopy(con)
-                    c[act] = m
-                    if m == "local":
-                        local_mem_requirement = action_configs[act][
-                            "local_mem_requirement"
-                        ]
-                        c["local_mem"] = c["local_mem"] + local_mem_requirement
-                        if c["local_mem"] < (node_mem * NODE_MEM_THRESHOLD):
-                            new_configs.append(dict(c))
-                        else:
-                            logger.info(
-                                f"config dropped for memory constraint: {c},\n\tcurrent node memory: {node_mem}\n\tavailable memory: {(node_mem * NODE_MEM_THRESHOLD)-c['local_mem'] }"
-                            )
-                    else:
-                        new_configs.append(dict(c))
-            all_configs = list(new_configs)
-        policy_state["remain_configs"] = all_configs
+        local_mem_req = [
+            action_configs[act]["local_mem_requirement"] for act in actions
+        ]
+        # construct list of possible configurations in Gray code order
+        # (bit k set means action k is remote). Consecutive codes differ in one
+        # action, but a switch can move several actions once configs between
+        # them are dropped for not fitting in memory.
+        all_remote = (1 << len(actions)) - 1
+        all_configs = []
+        dropped = 0
+        for i in range(1 << len(actions)):
+            gray = i ^ (i >> 1)
+            local_mem = jaseci_runtime_mem
+            for k in range(len(actions)):
+                if not gray >> k & 1:
+                    local_mem += local_mem_req[k]
+            # the all remote config needs no action memory and is always kept,
+            # dicts are only built for configs that are kept
+            if local_mem >= mem_limit and gray != all_remote:
+                dropped += 1
+                continue
+            c = {"local_mem": local_mem}
+            for k, act in enumerate(actions):
+                c[act] = MODE_REMOTE if gray >> k & 1 else MODE_LOCAL
+            all_configs.append(c)
+        if dropped:
+            logger.info(
+                "%s configs dropped for memory constraint,\n\tcurrent node memory: %s\n\tmemory limit: %s",
+                dropped,
+                node_mem,
+                mem_limit,
+            )
+        policy_state.remain_configs = deque(all_configs)
 
     def _actionpolicy_evaluation(self):
         """
@@ -306,152 +413,173 @@ class ActionsOptimizer:
         logger.info("===Evaluation Policy===")
         policy_state = self.policy_state["Evaluation"]
 
-        if len(policy_state) == 0:
+        if policy_state is None:
             # Initialize policy tracking state
-            policy_state = {
-                "phase": "eval",  # current phase of policy: eval|perf
-                "cur_config": None,  # current active configuration
-                "remain_configs": [],  # remaining configurations that need to be evaluated
-                "past_configs": [],  # configurations already evaluated
-                "eval_phase": self.policy_params.get(
-                    "eval_phase", 10
-                ),  # how long is evaluatin period (in seconds)
-                "perf_phase": self.policy_params.get(
-                    "perf_phase", 100
-                ),  # how long is the performance period (in seconds)
-                "cur_phase": 0,  # how long the current period has been running
-                "prev_best_config": self.actions_state.get_all_state(),
-            }
-        policy_state["cur_phase"] += self.jsorc_interval
+            policy_state = EvaluationState(
+                eval_phase=self.policy_params.get("eval_phase", 10),
+                perf_phase=self.policy_params.get("perf_phase", 100),
+                prev_best_config=self.actions_state.get_all_state(),
+            )
+            self.policy_state["Evaluation"] = policy_state
+        policy_state.cur_phase += self.jsorc_interval
 
-        # check if we should go into evaluation phase
-        if (
-            policy_state["phase"] == "perf"
-            and policy_state["cur_phase"] >= policy_state["perf_phase"]
-        ):
-            # if no enough walker were execueted in this period, keep in perf phase
-            if "walker_run" not in self.benchmark["requests"]:
-                policy_state["cur_phase"] = 0
-            else:
-                logger.info("===Evaluation Policy=== Switching to evaluation mode")
-                policy_state["phase"] = "eval"
-                policy_state["cur_phase"] = 0
-                policy_state["cur_config"] = None
-                if len(policy_state["remain_configs"]) == 0:
-                    self._init_evalution_policy(policy_state)
-        if policy_state["phase"] == "eval":
-            # In evaluation phase
-            if policy_state["cur_config"] is None:
-                self._init_evalution_policy(policy_state)
-
-                # This is the start of evaluation period
-                policy_state["cur_config"] = policy_state["remain_configs"][0]
-                del policy_state["remain_configs"][0]
-                policy_state["cur_phase"] = 0
-                self.benchmark["active"] = True
-                self.benchmark["requests"] = {}
-                self.actions_change = self._get_action_change(
-                    policy_state["cur_config"]
+        self._evaluation_handlers[policy_state.phase](policy_state)
+
+    def _walker_totals(self):
+        """
+        Return the summed latency and number of walker runs benchmarked
+        in the current period, excluding the _default_ walker
+        """
+        total_lat = 0.0
+        walker_count = 0
+        for walker, times in self.benchmark["requests"].get("walker_run", {}).items():
+            if walker == "_default_":
+                continue
+            total_lat += math.fsum(times)
+            walker_count += len(times)
+        return total_lat, walker_count
+
+    def _evaluation_perf(self, policy_state):
+        """
+        Evaluation policy performance phase.
+        Check if we should go into evaluation phase
+        """
+        if policy_state.cur_phase < policy_state.perf_phase:
+            return
+
+        # if no enough walker were execueted in this period, keep in perf phase
+        if "walker_run" not in self.benchmark["requests"]:
+            policy_state.cur_phase = 0
+            return
+
+        logger.info("===Evaluation Policy=== Switching to evaluation mode")
+        policy_state.phase = "eval"
+        policy_state.cur_phase = 0
+        policy_state.cur_config = None
+        if len(policy_state.remain_configs) == 0:
+            self._init_evalution_policy(policy_state)
+        self._evaluation_eval(policy_state)
+
+    def _evaluation_eval(self, policy_state):
+        """
+        Evaluation policy evaluation phase.
+        Benchmark the current config and move on to the next one once the period is over
+        """
+        if policy_state.cur_config is None:
+            self._init_evalution_policy(policy_state)
+
+            # This is the start of evaluation period
+            policy_state.cur_config = policy_state.remain_configs.popleft()
+            self.actions_change = self._get_action_change(policy_state.cur_config)
+            if len(self.actions_change) > 0:
+                logger.info(
+                    "===Evaluation Policy=== Switching eval config to %s",
+                    policy_state.cur_config,
                 )
-                if len(self.actions_change) > 0:
-                    logger.info(
-                        f"===Evaluation Policy=== Switching eval config to {policy_state['cur_config']}"
-                    )
-                    policy_state["phase"] = "eval_switching"
-                    self.benchmark["active"] = False
+                self._reset_eval_phase(policy_state, "eval_switching", active=False)
             else:
-                if policy_state["cur_phase"] >= policy_state["eval_phase"]:
-                    # The eval phase for the current configuration is complete
-                    # Get performance
-                    if "walker_run" not in self.benchmark["requests"]:
-                        # meaning no incoming requests during this period.
-                        # stay in this phase
-                        logger.info(f"===Evaluation Policy=== No walkers were executed")
-                        self.policy_state["Evaluation"] = policy_state
-                        return
-
-                    walker_runs = []
-                    for walker, times in self.benchmark["requests"][
-                        "walker_run"
-                    ].items():
-                        if walker == "_default_":
-                            continue
-                        else:
-                            walker_runs.extend(times)
-
-                    avg_walker_lat = sum(walker_runs) / len(walker_runs)
-                    policy_state["cur_config"]["avg_walker_lat"] = avg_walker_lat
-                    policy_state["past_configs"].append(policy_state["cur_config"])
-                    logger.info(
-                        f"===Evaluation Policy=== Complete evaluation period for {policy_state['cur_config']} latency: {avg_walker_lat}"
-                    )
-
-                    # check if all configs have been evaluated
-                    if len(policy_state["remain_configs"]) == 0:
-                        # best config is the one with the fastest walker latency during the evaluation period
-                        logger.info(f"===Evaluation Policy=== Evaluation phase over. ")
-                        best_config = min(
-                            policy_state["past_configs"],
-                            key=lambda x: x["avg_walker_lat"],
-                        )
-                        # Switch the system to the best config
-                        del best_config["avg_walker_lat"]
-                        self.actions_change = self._get_action_change(best_config)
-
-                        # ADAPTIVE: if the selected best config is the same config as the previous best one, double the performance period
-                        if all(
-                            [
-                                best_config[act]
-                                == policy_state["prev_best_config"][act]["mode"]
-                                for act in best_config.keys()
-                                if act in action_configs.keys()
-                            ]
-                        ):
-                            policy_state["perf_phase"] *= 2
-                            logger.info(
-                                f"===Evaluation Policy=== Best config is the same as previous one. Doubling performance phase to {policy_state['perf_phase']}"
-                            )
-
-                        policy_state["phase"] = "perf"
-                        policy_state["cur_config"] = None
-                        policy_state["past_configs"] = []
-                        policy_state["cur_phase"] = 0
-                        self.benchmark["requests"] = {}
-                        self.benchmark["active"] = True
-                        logger.info(
-                            f"===Evaluation Policy=== Evaluation phase over. Selected best config as {best_config}"
-                        )
-                    else:
-                        next_config = policy_state["remain_configs"][0]
-                        del policy_state["remain_configs"][0]
-                        self.actions_change = self._get_action_change(next_config)
-                        policy_state["cur_config"] = next_config
-                        policy_state["cur_phase"] = 0
-                        self.benchmark["requests"] = {}
-                        if len(self.actions_change) > 0:
-                            logger.info(
-                                f"===Evaluation Policy=== Switching eval config to {policy_state['cur_config']}"
-                            )
-                            policy_state["phase"] = "eval_switching"
-                            self.benchmark["active"] = False
-                        else:
-                            policy_state["phase"] = "eval"
-                            self.benchmark["active"] = True
-                        logger.info(
-                            f"===Evaluation Policy=== Switching to next config to evaluate {next_config}"
-                        )
-        elif policy_state["phase"] == "eval_switching":
-            # in the middle of switching between configs for evaluation
-            if len(self.actions_change) == 0:
-                # this means all actions change have been applied, start evaluation phase
+                self._reset_eval_phase(policy_state, "eval", active=True)
+            return
+
+        if policy_state.cur_phase < policy_state.eval_phase:
+            return
+
+        # The eval phase for the current configuration is complete
+        # Get performance
+        total_lat, walker_count = self._walker_totals()
+        if walker_count == 0:
+            # meaning no incoming requests during this period.
+            # stay in this phase
+            logger.info("===Evaluation Policy=== No walkers were executed")
+            return
+
+        avg_walker_lat = total_lat / walker_count
+        policy_state.cur_config["avg_walker_lat"] = avg_walker_lat
+        policy_state.past_configs.append(policy_state.cur_config)
+        if avg_walker_lat < policy_state.best_lat:
+            policy_state.best_lat = avg_walker_lat
+            policy_state.best_config = policy_state.cur_config
+        logger.info(
+            "===Evaluation Policy=== Complete evaluation period for %s latency: %s",
+            policy_state.cur_config,
+            avg_walker_lat,
+        )
+
+        # check if all configs have been evaluated
+        if len(policy_state.remain_configs) == 0:
+            # best config is the one with the fastest walker latency during the evaluation period
+            logger.info("===Evaluation Policy=== Evaluation phase over. ")
+            # keep only the action -> mode entries, built as a new dict so the
+            # evaluated entry in past_configs stays intact
+            best_config = {
+                act: mode
+                for act, mode in policy_state.best_config.items()
+                if act not in ("avg_walker_lat", "local_mem")
+            }
+            # Switch the system to the best config
+            self.actions_change = self._get_action_change(best_config)
+
+            # ADAPTIVE: if the selected best config is the same config as the previous best one, double the performance period
+            prev_best_config = policy_state.prev_best_config
+            if all(
+                mode == prev_best_config[act]["mode"]
+                for act, mode in best_config.items()
+                if act in action_configs
+            ):
+                policy_state.perf_phase *= 2
                 logger.info(
-                    f"===Evaluation Policy=== All actions change have been applied. Start evaluation phase."
+                    "===Evaluation Policy=== Best config is the same as previous one. Doubling performance phase to %s",
+                    policy_state.perf_phase,
                 )
-                policy_state["phase"] = "eval"
-                policy_state["cur_phase"] = 0
-                self.benchmark["active"] = True
-                self.benchmark["requests"] = {}
-        self.policy_state["Evaluation"] = policy_state
+
+            policy_state.cur_config = None
+            # hand the finished round over as is, past_configs starts afresh
+            self.last_eval_configs = policy_state.past_configs
+            policy_state.past_configs = []
+            policy_state.best_config = None
+            policy_state.best_lat = float("inf")
+            self._reset_eval_phase(policy_state, "perf", active=True)
+            logger.info(
+                "===Evaluation Policy=== Evaluation phase over. Selected best config as %s",
+                best_config,
+            )
+        else:
+            next_config = policy_state.remain_configs.popleft()
+            self.actions_change = self._get_action_change(next_config)
+            policy_state.cur_config = next_config
+            if len(self.actions_change) > 0:
+                logger.info(
+                    "===Evaluation Policy=== Switching eval config to %s",
+                    policy_state.cur_config,
+                )
+                self._reset_eval_phase(policy_state, "eval_switching", active=False)
+            else:
+                self._reset_eval_phase(policy_state, "eval", active=True)
+            logger.info(
+                "===Evaluation Policy=== Switching to next config to evaluate %s",
+                next_config,
+            )
+
+    def _evaluation_switching(self, policy_state):
+        """
+        Evaluation policy switching phase.
+        In the middle of switching between configs for evaluation
+        """
+        if len(self.actions_change) == 0:
+            # this means all actions change have been applied, start evaluation phase
+            logger.info(
+                "===Evaluation Policy=== All actions change have been applied. Start evaluation phase."
+            )
+            self._reset_eval_phase(policy_state, "eval", active=True)
+
+    def _reset_eval_phase(self, policy_state, phase, active):
+        """
+        Enter the given evaluation policy phase with a fresh period and benchmark
+        """
+        policy_state.phase = phase
+        policy_state.cur_phase = 0
+        self.benchmark["requests"] = {}
+        self.benchmark["active"] = active
 
     def _get_action_change(self, new_action_state):
         """
@@ -459,13 +587,14 @@ class ActionsOptimizer:
         """
         change_state = {}
         for name, new_state in new_action_state.items():
-            if name not in action_configs.keys():
+            # action_configs fills in at runtime, so check it live
+            if name not in action_configs:
                 continue
             cur = self.actions_state.get_state(name)
             if cur is None:
                 cur = self.actions_state.init_state(name)
-            if new_state == "local":
-                new_state = "module"
+            if new_state == MODE_LOCAL:
+                new_state = MODE_MODULE
             if new_state != cur["mode"]:
                 change_str = (
                     f"{cur['mode'] if cur['mode'] is not None else ''}_to_{new_state}"
@@ -477,28 +606,36 @@ class ActionsOptimizer:
         """
         Apply any action configuration changes
         """
-        actions_change = dict(self.actions_change)
-        # For now, to_* and *_to_* are the same logic
-        # But this might change down the line
+        actions_change = self.actions_change
+
+        # Probe every remote service that is still starting up in one fan-out
+        # instead of waiting on each readiness check in turn
+        starting = []
         for name, change_type in actions_change.items():
-            logger.info(f"==Actions Optimizer== Changing {name} {change_type}")
-            if change_type in ["to_local", "_to_local", "_to_module", "to_module"]:
-                # Switching from no action loaded to local
-                self.load_action_module(name)
-                del self.actions_change[name]
-            elif change_type == "to_remote":
-                loaded = self.load_action_remote(name)
-                if loaded:
-                    del self.actions_change[name]
-            elif change_type == "local_to_remote" or change_type == "module_to_remote":
-                # loaded = self.load_action_remote(name, unload_existing=True)
-                loaded = self.load_action_remote(name)
-                if loaded:
-                    del self.actions_change[name]
-            elif change_type == "remote_to_local" or change_type == "remote_to_module":
-                # self.load_action_module(name, unload_existing=True)
-                self.load_action_module(name)
-                del self.actions_change[name]
+            if not change_type.endswith("to_remote"):
+                continue
+            cur_state = self.actions_state.get_state(name)
+            if cur_state is not None and cur_state["remote"]["status"] == "STARTING":
+                starting.append((name, cur_state["remote"]["url"]))
+        not_ready = self._ready_check_batch(starting) if starting else set()
+
+        # For now, to_* and *_to_* are the same logic, existing actions are
+        # not unloaded (unload_existing=True). But this might change down the line
+        pending = {}
+        for name, change_type in actions_change.items():
+            if name in not_ready:
+                # Still starting up, retry on the next interval
+                pending[name] = change_type
+                continue
+            loader = self._CHANGE_DISPATCH.get(change_type)
+            if loader is None:
+                pending[name] = change_type
+                continue
+            logger.info("==Actions Optimizer== Changing %s %s", name, change_type)
+            if not getattr(self, loader)(name):
+                pending[name] = change_type
+        # changes that did not go through are retried on the next interval
+        self.actions_change = pending
 
         if len(actions_change) > 0 and self.actions_history["active"]:
             # Summarize action stats during this period and add to previous state
@@ -509,8 +646,8 @@ class ActionsOptimizer:
 
     def summarize_action_calls(self):
         actions_summary = {}
-        for action_name, calls in self.actions_calls.items():
-            actions_summary[action_name] = sum(calls) / len(calls)
+        for action_name, (total, count) in self.actions_calls.items():
+            actions_summary[action_name] = total / count
         self.actions_calls.clear()
 
         if len(self.actions_history["history"]) > 0:
@@ -1,3 +1,9 @@
+# Action load modes, shared with the ActionsOptimizer
+MODE_LOCAL = "local"
+MODE_MODULE = "module"
+MODE_REMOTE = "remote"
+
+
 class ActionsState:
     """
     An object tracking the various states of available actions. Utilized by the ActionsOptimizer and ActionsOptimizerPolicy
@@ -44,10 +50,10 @@ class ActionsState:
         return list(self.state.keys())
 
     def local_action_loaded(self, name):
-        self.state[name]["mode"] = "local"
+        self.state[name]["mode"] = MODE_LOCAL
 
     def module_action_loaded(self, name, module, loaded):
-        self.state[name]["mode"] = "module"
+        self.state[name]["mode"] = MODE_MODULE
         self.state[name]["module"]["name"] = module
         self.state[name]["module"]["loaded_module"] = loaded
 
@@ -62,7 +68,7 @@ class ActionsState:
         self.state[name]["remote"] = {"url": None, "status": None}
 
     def remote_action_loaded(self, name):
-        self.state[name]["mode"] = "remote"
+        self.state[name]["mode"] = MODE_REMOTE
 
     def start_remote_service(self, name, url):
         self.state[name]["remote"] = {"status": "STARTING", "url": url}
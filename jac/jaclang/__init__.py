@@ -1,7 +1,7 @@
 """The Jac Programming Language."""
 
-import inspect
 import os
+import sys
 from abc import ABCMeta, abstractmethod as abstract
 from dataclasses import dataclass, field as dc_field
 from types import ModuleType
@@ -383,7 +383,7 @@ def jac_import(
     reload_module: bool | None = False,
 ) -> tuple[ModuleType, ...]:
     """Import a module."""
-    base_path = base_path or os.path.dirname(inspect.stack()[1].filename)
+    base_path = base_path or os.path.dirname(sys._getframe(1).f_code.co_filename)
     return Jac.jac_import(
         target=target,
         lng=lng,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import contextlib
 import inspect
 import marshal
 import os
@@ -302,8 +303,8 @@ class JacProgram:
             return marshal.loads(codeobj) if isinstance(codeobj, bytes) else None
         gen_dir = os.path.join(caller_dir, Con.JAC_GEN_DIR)
         pyc_file_path = os.path.join(gen_dir, module_name + ".jbc")
-        if cachable and os.path.exists(pyc_file_path) and not reload:
-            with open(pyc_file_path, "rb") as f:
+        if cachable and not reload:
+            with contextlib.suppress(FileNotFoundError), open(pyc_file_path, "rb") as f:
                 return marshal.load(f)
 
         result = compile_jac(full_target, cache_result=cachable)
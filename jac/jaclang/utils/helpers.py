@@ -55,8 +55,13 @@ def get_ast_nodes_as_snake_case() -> list[str]:
     classes = inspect.getmembers(module, inspect.isclass)
     ast_node_classes = [cls for _, cls in classes if issubclass(cls, ast.AstNode)]
 
+    # Index class definitions in file order with a single pass over the source.
+    order = {
+        m.group(1): i
+        for i, m in enumerate(re.finditer(r"^class (\w+)", source_code, re.M))
+    }
     ordered_classes = sorted(
-        ast_node_classes, key=lambda cls: source_code.find(f"class {cls.__name__}")
+        ast_node_classes, key=lambda cls: order.get(cls.__name__, -1)
     )
     snake_names = []
     for cls in ordered_classes: